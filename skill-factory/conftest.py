@@ -0,0 +1,40 @@
+"""
+Shared pytest configuration for the skill-factory test suite
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+
+# Make the skill-factory modules importable from the tests, once per session;
+# pytest.ini uses --import-mode=importlib, so this is the only sys.path entry added
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
+
+
+# Keep test working trees (tmp_path and tempfile.mkdtemp) on a RAM-backed
+# filesystem. PYTEST_TMPFS names one explicitly; otherwise /dev/shm is used
+# when it is available and TMPDIR has not been set.
+_TMPFS = os.environ.get('PYTEST_TMPFS')
+if _TMPFS is None and 'TMPDIR' not in os.environ:
+    _TMPFS = '/dev/shm'
+if _TMPFS and os.path.isdir(_TMPFS) and os.access(_TMPFS, os.W_OK):
+    tempfile.tempdir = _TMPFS
+
+
+@pytest.fixture
+def skill_path(tmp_path):
+    """Empty skill folder named like a valid skill"""
+    path = tmp_path / "test-skill"
+    path.mkdir()
+    return path
+
+
+def pytest_report_header(config):
+    """Show whether PyYAML has LibYAML, since every config and SKILL.md parse depends on it"""
+    import yaml
+    return f"PyYAML {yaml.__version__} (libyaml: {'yes' if yaml.__with_libyaml__ else 'no'})"
@@ -17,10 +17,18 @@ import os
 import re
 import json
 import shutil
+import functools
+from collections import Counter
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, Union, IO
 from datetime import datetime
 
+# Use the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 # Custom Exception Classes
 class ConfigValidationError(Exception):
@@ -49,6 +57,10 @@ class ConfigValidator:
     VALID_OVERLAP_STRATEGIES = ['overlapping', 'mutually_exclusive']
     VALID_SAMPLE_DATA_TYPES = ['csv', 'json', 'excel', 'pdf', 'image', 'text', 'api', 'none']
     
+    # Set views for membership checks; the lists above keep message ordering stable
+    _OVERLAP_STRATEGY_SET = frozenset(VALID_OVERLAP_STRATEGIES)
+    _SAMPLE_DATA_TYPE_SET = frozenset(VALID_SAMPLE_DATA_TYPES)
+    
     PLACEHOLDER_PATTERNS = [
         r'\[YOUR[_\s].*?\]',
         r'\[FILL[_\s].*?\]',
@@ -58,6 +70,9 @@ class ConfigValidator:
         r'\[Example:.*?\]',
     ]
     
+    # All placeholder patterns compiled once into a single alternation
+    PLACEHOLDER_REGEX = re.compile('|'.join(PLACEHOLDER_PATTERNS), re.IGNORECASE)
+    
     def __init__(self, config: dict):
         self.config = config
         self.errors: List[str] = []
@@ -152,7 +167,7 @@ class ConfigValidator:
             
             # Check overlap_strategy is valid
             strategy = self.config['skills'].get('overlap_strategy')
-            if strategy and strategy not in self.VALID_OVERLAP_STRATEGIES:
+            if strategy and (not isinstance(strategy, str) or strategy not in self._OVERLAP_STRATEGY_SET):
                 self.errors.append(
                     f"Invalid 'overlap_strategy': '{strategy}'\n"
                     f"  Valid options: {', '.join(self.VALID_OVERLAP_STRATEGIES)}\n"
@@ -165,7 +180,7 @@ class ConfigValidator:
                 for i, uc in enumerate(use_cases, 1):
                     if isinstance(uc, dict):
                         data_type = uc.get('sample_data_type')
-                        if data_type and data_type not in self.VALID_SAMPLE_DATA_TYPES:
+                        if data_type and (not isinstance(data_type, str) or data_type not in self._SAMPLE_DATA_TYPE_SET):
                             self.errors.append(
                                 f"Invalid 'sample_data_type' in use case {i}: '{data_type}'\n"
                                 f"  Valid options: {', '.join(self.VALID_SAMPLE_DATA_TYPES)}\n"
@@ -189,11 +204,11 @@ class ConfigValidator:
             use_cases = self.config['skills'].get('use_cases', [])
             if isinstance(use_cases, list):
                 # Check for duplicate use case names
-                names = [uc.get('name') for uc in use_cases if isinstance(uc, dict) and 'name' in uc]
-                if len(names) != len(set(names)):
-                    duplicates = [name for name in names if names.count(name) > 1]
+                name_counts = Counter(uc.get('name') for uc in use_cases if isinstance(uc, dict) and 'name' in uc)
+                duplicates = [name for name, count in name_counts.items() if count > 1]
+                if duplicates:
                     self.errors.append(
-                        f"Duplicate use case names found: {', '.join(set(duplicates))}\n"
+                        f"Duplicate use case names found: {', '.join(duplicates)}\n"
                         f"  Fix: Each use case must have a unique name"
                     )
                 
@@ -213,34 +228,45 @@ class ConfigValidator:
         """Detect placeholder text that wasn't replaced"""
         config_str = json.dumps(self.config, indent=2)
         
-        for pattern in self.PLACEHOLDER_PATTERNS:
-            matches = re.findall(pattern, config_str, re.IGNORECASE)
-            if matches:
-                self.warnings.append(
-                    f"Placeholder text detected: {matches[0][:50]}...\n"
-                    f"  Recommendation: Replace placeholder text with actual content\n"
-                    f"  Found {len(matches)} placeholder(s) in total"
-                )
-                break  # Only warn once about placeholders
+        matches = self.PLACEHOLDER_REGEX.findall(config_str)
+        if matches:
+            # Only warn once about placeholders
+            self.warnings.append(
+                f"Placeholder text detected: {matches[0][:50]}...\n"
+                f"  Recommendation: Replace placeholder text with actual content\n"
+                f"  Found {len(matches)} placeholder(s) in total"
+            )
 
 
 class SkillsGenerator:
     """Orchestrates the generation of Claude Skills prompt from configuration."""
     
+    # Matches template variables such as {{SKILL_COUNT}}
+    TEMPLATE_VAR_PATTERN = re.compile(r'\{\{([A-Z_]+)\}\}')
+    
     def __init__(self, config_path: str = "skills_config.yaml"):
         """Initialize the generator with a config file path."""
         self.config_path = config_path
         self.config: Dict[str, Any] = {}
         self.template_path = "skill_generation_prompt.md"
         
-    def load_config(self) -> None:
-        """Load and validate the configuration file."""
+    def load_config(self, source: Union[str, os.PathLike, IO[str], None] = None) -> None:
+        """
+        Load the configuration.
+        source may be a path or an open text stream; defaults to self.config_path.
+        """
+        if source is None:
+            source = self.config_path
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = yaml.safe_load(f)
-            print(f"✓ Configuration loaded from {self.config_path}")
+            if hasattr(source, 'read'):
+                self.config = yaml.load(source, Loader=YamlLoader)
+                source = getattr(source, 'name', '<stream>')
+            else:
+                with open(source, 'r', encoding='utf-8') as f:
+                    self.config = yaml.load(f, Loader=YamlLoader)
+            print(f"✓ Configuration loaded from {source}")
         except FileNotFoundError:
-            print(f"✗ Error: Configuration file '{self.config_path}' not found.")
+            print(f"✗ Error: Configuration file '{source}' not found.")
             print(f"  Please create a configuration file or specify a valid path.")
             sys.exit(1)
         except yaml.YAMLError as e:
@@ -405,22 +431,24 @@ Consider these constraints when designing workflows and selecting approaches.
         
         # Basic replacements
         replacements = {
-            '{{SKILL_COUNT}}': str(skills.get('count', 3)),
-            '{{BUSINESS_DESCRIPTION}}': business.get('description', 'Not provided').strip(),
-            '{{INDUSTRY}}': business.get('industry', 'Not specified'),
-            '{{TEAM_SIZE}}': business.get('team_size', 'Not specified'),
-            '{{PRIMARY_WORKFLOWS}}': self.format_list(business.get('primary_workflows', [])),
-            '{{OVERLAP_STRATEGY}}': skills.get('overlap_strategy', 'overlapping'),
-            '{{USE_CASES_SECTION}}': self.generate_use_cases_section(),
-            '{{OVERLAP_GUIDANCE}}': self.generate_overlap_guidance(),
-            '{{DOMAIN_KNOWLEDGE_SECTION}}': self.generate_domain_knowledge_section(),
-            '{{INTEGRATIONS_SECTION}}': self.generate_integrations_section(),
-            '{{CONSTRAINTS_SECTION}}': self.generate_constraints_section(),
+            'SKILL_COUNT': str(skills.get('count', 3)),
+            'BUSINESS_DESCRIPTION': business.get('description', 'Not provided').strip(),
+            'INDUSTRY': business.get('industry', 'Not specified'),
+            'TEAM_SIZE': business.get('team_size', 'Not specified'),
+            'PRIMARY_WORKFLOWS': self.format_list(business.get('primary_workflows', [])),
+            'OVERLAP_STRATEGY': skills.get('overlap_strategy', 'overlapping'),
+            'USE_CASES_SECTION': self.generate_use_cases_section(),
+            'OVERLAP_GUIDANCE': self.generate_overlap_guidance(),
+            'DOMAIN_KNOWLEDGE_SECTION': self.generate_domain_knowledge_section(),
+            'INTEGRATIONS_SECTION': self.generate_integrations_section(),
+            'CONSTRAINTS_SECTION': self.generate_constraints_section(),
         }
         
-        populated = template
-        for key, value in replacements.items():
-            populated = populated.replace(key, value)
+        # Substitute every variable in a single pass; unknown variables are left as-is
+        populated = self.TEMPLATE_VAR_PATTERN.sub(
+            lambda m: str(replacements.get(m.group(1), m.group(0))),
+            template
+        )
         
         print("✓ Template populated with configuration values")
         return populated
@@ -568,6 +596,7 @@ Overlap Strategy: {self.config.get('skills', {}).get('overlap_strategy', 'unknow
             print(f"⚠ Warning: Could not write generation log: {e}")
     
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _slugify(text: str) -> str:
         """Convert text to a slug format (lowercase, hyphens)."""
         return text.lower().replace(' ', '-').replace('_', '-')
@@ -21,7 +21,7 @@ from typing import List, Optional
 
 # Import validator
 try:
-    from validate_skill import SkillValidator, Severity
+    from validate_skill import SkillValidator
     HAS_VALIDATOR = True
 except ImportError:
     HAS_VALIDATOR = False
@@ -61,11 +61,16 @@ class SkillPackager:
         '*~',
     ]
     
-    def __init__(self, skill_path: str, validate: bool = True, force: bool = False):
+    # Read size used when hashing files for the manifest
+    CHECKSUM_CHUNK_SIZE = 64 * 1024
+    
+    def __init__(self, skill_path: str, validate: bool = True, force: bool = False,
+                 compression: int = zipfile.ZIP_DEFLATED):
         self.skill_path = Path(skill_path)
         self.skill_name = self.skill_path.name
         self.should_validate = validate and HAS_VALIDATOR
         self.force = force
+        self.compression = compression
         self.packager_version = "1.0"
     
     def package(self, output_path: Optional[str] = None) -> str:
@@ -90,10 +95,8 @@ class SkillPackager:
             if self.should_validate:
                 print(f"Validating skill '{self.skill_name}'...")
                 validator = SkillValidator(str(self.skill_path))
-                is_valid, issues = validator.validate()
-                
-                errors = [i for i in issues if i.severity == Severity.ERROR]
-                warnings = [i for i in issues if i.severity == Severity.WARNING]
+                result = validator.validate()
+                errors, warnings = result.errors, result.warnings
                 
                 if errors:
                     if not self.force:
@@ -171,7 +174,7 @@ class SkillPackager:
         """
         file_count = 0
         
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        with zipfile.ZipFile(output_path, 'w', self.compression) as zf:
             # Add SKILL.md at root (required)
             skill_md = self.skill_path / "SKILL.md"
             if skill_md.exists():
@@ -243,10 +246,15 @@ class SkillPackager:
             if skill_md_path.exists():
                 content = skill_md_path.read_text(encoding='utf-8')
                 if content.startswith('---\n'):
+                    # LibYAML-backed loader when available, as in validate_skill and generate_skills
                     import yaml
+                    try:
+                        from yaml import CSafeLoader as YamlLoader
+                    except ImportError:
+                        from yaml import SafeLoader as YamlLoader
                     parts = content.split('---\n', 2)
                     if len(parts) >= 3:
-                        frontmatter = yaml.safe_load(parts[1])
+                        frontmatter = yaml.load(parts[1], Loader=YamlLoader)
                         if frontmatter:
                             if 'description' in frontmatter:
                                 manifest['description'] = frontmatter['description']
@@ -307,8 +315,8 @@ class SkillPackager:
         
         try:
             with open(file_path, "rb") as f:
-                # Read file in 4096-byte chunks
-                for byte_block in iter(lambda: f.read(4096), b""):
+                # Read file in 64 KB chunks (typical skill files fit in one read)
+                for byte_block in iter(lambda: f.read(self.CHECKSUM_CHUNK_SIZE), b""):
                     sha256_hash.update(byte_block)
             
             return sha256_hash.hexdigest()
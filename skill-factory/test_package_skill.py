@@ -3,25 +3,15 @@
 Unit tests for package_skill.py
 """
 
-import unittest
-import tempfile
-import shutil
 import zipfile
 import json
+import hashlib
 from pathlib import Path
-from package_skill import SkillPackager
 
+import pytest
 
-class TestSkillPackager(unittest.TestCase):
-    
-    def setUp(self):
-        """Create temporary skill folder for testing"""
-        self.test_dir = tempfile.mkdtemp()
-        self.skill_path = Path(self.test_dir) / "test-skill"
-        self.skill_path.mkdir()
-        
-        # Create minimal valid SKILL.md
-        skill_md_content = """---
+
+SKILL_MD_BYTES = b"""---
 name: test-skill
 description: Test skill for unit testing the packaging system to ensure all components work correctly.
 license: MIT
@@ -41,266 +31,278 @@ Use for testing the packaging system.
 
 Run tests to validate functionality.
 """
-        (self.skill_path / "SKILL.md").write_text(skill_md_content, encoding='utf-8')
-    
-    def tearDown(self):
-        """Clean up temporary directory"""
-        shutil.rmtree(self.test_dir)
-    
-    def test_basic_packaging(self):
-        """Should create valid zip file"""
-        packager = SkillPackager(str(self.skill_path), validate=False)
-        zip_path = packager.package()
-        
-        self.assertIsNotNone(zip_path)
-        self.assertTrue(Path(zip_path).exists())
-        
-        # Verify zip contains SKILL.md
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            names = zf.namelist()
-            self.assertIn("SKILL.md", names)
-    
-    def test_excludes_testing_guide(self):
-        """TESTING_GUIDE folder should not be in package"""
-        # Create TESTING_GUIDE folder
-        testing_guide_dir = self.skill_path / "TESTING_GUIDE"
-        testing_guide_dir.mkdir()
-        (testing_guide_dir / "test.md").write_text("Test data")
-        
-        packager = SkillPackager(str(self.skill_path), validate=False)
-        zip_path = packager.package()
-        
-        # Verify TESTING_GUIDE is not in zip
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            names = zf.namelist()
-            testing_guide_files = [n for n in names if 'TESTING_GUIDE' in n]
-            self.assertEqual(len(testing_guide_files), 0)
-    
-    def test_includes_scripts_folder(self):
-        """scripts/ folder should be included with structure"""
-        # Create scripts folder
-        scripts_dir = self.skill_path / "scripts"
-        scripts_dir.mkdir()
-        (scripts_dir / "test_script.py").write_text("print('test')")
-        
-        packager = SkillPackager(str(self.skill_path), validate=False)
-        zip_path = packager.package()
-        
-        # Verify scripts are in zip
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            names = zf.namelist()
-            self.assertIn("scripts/test_script.py", names)
-    
-    def test_manifest_generated(self):
-        """manifest.json should be included"""
-        packager = SkillPackager(str(self.skill_path), validate=False)
-        zip_path = packager.package()
-        
-        # Verify manifest.json is in zip
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            names = zf.namelist()
-            self.assertIn("manifest.json", names)
-            
-            # Read and parse manifest
-            manifest_content = zf.read("manifest.json")
-            manifest = json.loads(manifest_content)
-            
-            # Check manifest structure
-            self.assertIn("name", manifest)
-            self.assertIn("version", manifest)
-            self.assertIn("created", manifest)
-            self.assertIn("files", manifest)
-            self.assertEqual(manifest["name"], "test-skill")
-    
-    def test_excludes_zip_files(self):
-        """Existing .zip files should not be included"""
-        # Create a dummy zip file
-        (self.skill_path / "old.zip").write_text("dummy")
-        
-        packager = SkillPackager(str(self.skill_path), validate=False)
-        zip_path = packager.package()
-        
-        # Verify old.zip is not in package
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            names = zf.namelist()
-            zip_files = [n for n in names if n.endswith('.zip')]
-            self.assertEqual(len(zip_files), 0)
-    
-    def test_excludes_pycache(self):
-        """__pycache__ should not be included"""
-        # Create __pycache__ folder
-        scripts_dir = self.skill_path / "scripts"
-        scripts_dir.mkdir()
-        pycache_dir = scripts_dir / "__pycache__"
-        pycache_dir.mkdir()
-        (pycache_dir / "test.pyc").write_text("compiled")
-        
-        packager = SkillPackager(str(self.skill_path), validate=False)
-        zip_path = packager.package()
-        
-        # Verify __pycache__ is not in zip
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            names = zf.namelist()
-            pycache_files = [n for n in names if '__pycache__' in n or n.endswith('.pyc')]
-            self.assertEqual(len(pycache_files), 0)
-    
-    def test_includes_references_folder(self):
-        """references/ folder should be included"""
-        # Create references folder
-        refs_dir = self.skill_path / "references"
-        refs_dir.mkdir()
-        (refs_dir / "schema.md").write_text("# Schema documentation")
-        
-        packager = SkillPackager(str(self.skill_path), validate=False)
-        zip_path = packager.package()
-        
-        # Verify references are in zip
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            names = zf.namelist()
-            self.assertIn("references/schema.md", names)
-    
-    def test_includes_assets_folder(self):
-        """assets/ folder should be included"""
-        # Create assets folder
-        assets_dir = self.skill_path / "assets"
-        assets_dir.mkdir()
-        (assets_dir / "template.txt").write_text("Template content")
-        
-        packager = SkillPackager(str(self.skill_path), validate=False)
-        zip_path = packager.package()
-        
-        # Verify assets are in zip
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            names = zf.namelist()
-            self.assertIn("assets/template.txt", names)
-    
-    def test_includes_license_file(self):
-        """LICENSE.txt should be included if present"""
-        (self.skill_path / "LICENSE.txt").write_text("MIT License...")
-        
-        packager = SkillPackager(str(self.skill_path), validate=False)
-        zip_path = packager.package()
-        
-        # Verify LICENSE.txt is in zip
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            names = zf.namelist()
-            self.assertIn("LICENSE.txt", names)
-    
-    def test_checksum_calculation(self):
-        """Should calculate checksums for files"""
-        packager = SkillPackager(str(self.skill_path), validate=False)
-        
-        # Test checksum calculation
-        checksum = packager._calculate_checksum(self.skill_path / "SKILL.md")
-        
-        # Should be a hex string
-        self.assertIsInstance(checksum, str)
-        self.assertEqual(len(checksum), 64)  # SHA256 is 64 hex characters
-    
-    def test_format_size(self):
-        """Should format file sizes correctly"""
-        packager = SkillPackager(str(self.skill_path), validate=False)
-        
-        self.assertIn("B", packager._format_size(100))
-        self.assertIn("KB", packager._format_size(2048))
-        self.assertIn("MB", packager._format_size(2 * 1024 * 1024))
-    
-    def test_package_without_validation(self):
-        """Should package without validation when validate=False"""
-        packager = SkillPackager(str(self.skill_path), validate=False)
-        zip_path = packager.package()
-        
-        self.assertIsNotNone(zip_path)
-        self.assertTrue(Path(zip_path).exists())
+SKILL_MD_SHA256 = hashlib.sha256(SKILL_MD_BYTES).hexdigest()
+
+
+def _create_base_skill(parent: Path) -> Path:
+    """Create minimal valid skill folder under parent"""
+    skill_path = parent / "test-skill"
+    skill_path.mkdir()
+    (skill_path / "SKILL.md").write_bytes(SKILL_MD_BYTES)
+    return skill_path
+
+
+def _zip_names(zip_path) -> set:
+    """Return the member names of a packaged zip as a set for O(1) membership checks"""
+    with zipfile.ZipFile(zip_path, 'r') as zf:
+        return set(zf.namelist())
+
+
+def _read_package(zip_path):
+    """Open a packaged zip once and return (member names, parsed manifest)"""
+    with zipfile.ZipFile(zip_path, 'r') as zf:
+        names = set(zf.namelist())
+        with zf.open("manifest.json") as f:
+            return names, json.load(f)
+
+
+@pytest.fixture(scope="module")
+def make_packager():
+    """Build SkillPackager instances; package_skill is imported on first use, not at collection"""
+    from package_skill import SkillPackager
     
-    def test_missing_skill_md_fails(self):
-        """Should fail if SKILL.md is missing"""
-        # Remove SKILL.md
-        (self.skill_path / "SKILL.md").unlink()
-        
-        packager = SkillPackager(str(self.skill_path), validate=False)
-        
-        with self.assertRaises(ValueError):
-            packager.package()
+    def _make(skill_path, **kwargs):
+        kwargs.setdefault('validate', False)
+        # Fixture payloads are tiny; storing skips zlib without changing the layout under test
+        kwargs.setdefault('compression', zipfile.ZIP_STORED)
+        return SkillPackager(str(skill_path), **kwargs)
+    return _make
+
+
+@pytest.fixture
+def base_skill(tmp_path):
+    """Create minimal valid skill folder for testing"""
+    return _create_base_skill(tmp_path)
+
+
+@pytest.fixture(scope="module")
+def packaged_base_zip(tmp_path_factory, make_packager):
+    """Package the unmodified base skill once for tests that only read the zip"""
+    skill_path = _create_base_skill(tmp_path_factory.mktemp("packaged"))
+    return make_packager(skill_path).package()
+
+
+@pytest.fixture
+def skill_tree(base_skill):
+    """Factory that adds extra files to the base skill: {relative_path: content}"""
+    def _build(extras=None):
+        for rel_path, content in (extras or {}).items():
+            file_path = base_skill / rel_path
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text(content)
+        return base_skill
+    return _build
+
+
+def test_basic_packaging(packaged_base_zip):
+    """Should create valid zip file"""
+    zip_path = packaged_base_zip
+
+    assert zip_path is not None
+    assert Path(zip_path).exists()
+
+    # Verify zip contains SKILL.md
+    names = _zip_names(zip_path)
+    assert "SKILL.md" in names
+
+
+def test_excludes_testing_guide(skill_tree, make_packager):
+    """TESTING_GUIDE folder should not be in package"""
+    skill_path = skill_tree({"TESTING_GUIDE/test.md": "Test data"})
+
+    packager = make_packager(skill_path)
+    zip_path = packager.package()
+
+    # Verify TESTING_GUIDE is not in zip
+    names = _zip_names(zip_path)
+    testing_guide_files = [n for n in names if 'TESTING_GUIDE' in n]
+    assert len(testing_guide_files) == 0
+
+
+@pytest.mark.parametrize("subdir,filename,content", [
+    ("scripts", "test_script.py", "print('test')"),
+    ("references", "schema.md", "# Schema documentation"),
+    ("assets", "template.txt", "Template content"),
+    ("", "LICENSE.txt", "MIT License..."),
+])
+def test_includes_optional_content(skill_tree, subdir, filename, content, make_packager):
+    """scripts/, references/, assets/ and LICENSE.txt should be included with structure"""
+    arcname = f"{subdir}/{filename}" if subdir else filename
+    skill_path = skill_tree({arcname: content})
+
+    packager = make_packager(skill_path)
+    zip_path = packager.package()
+
+    names = _zip_names(zip_path)
+    assert arcname in names
+
+
+def test_manifest_generated(packaged_base_zip):
+    """manifest.json should be included"""
+    zip_path = packaged_base_zip
+
+    # Verify manifest.json is in zip and parse it from the same handle
+    names, manifest = _read_package(zip_path)
+    assert "manifest.json" in names
+
+    # Check manifest structure
+    assert "name" in manifest
+    assert "version" in manifest
+    assert "created" in manifest
+    assert "files" in manifest
+    assert manifest["name"] == "test-skill"
+
+
+def test_excludes_zip_files(skill_tree, make_packager):
+    """Existing .zip files should not be included"""
+    skill_path = skill_tree({"old.zip": "dummy"})
+
+    packager = make_packager(skill_path)
+    zip_path = packager.package()
+
+    # Verify old.zip is not in package
+    names = _zip_names(zip_path)
+    zip_files = [n for n in names if n.endswith('.zip')]
+    assert len(zip_files) == 0
+
+
+def test_excludes_pycache(skill_tree, make_packager):
+    """__pycache__ should not be included"""
+    skill_path = skill_tree({"scripts/__pycache__/test.pyc": "compiled"})
+
+    packager = make_packager(skill_path)
+    zip_path = packager.package()
+
+    # Verify __pycache__ is not in zip
+    names = _zip_names(zip_path)
+    pycache_files = [n for n in names if '__pycache__' in n or n.endswith('.pyc')]
+    assert len(pycache_files) == 0
+
+
+def test_default_compression_is_deflated(base_skill, tmp_path):
+    """Packages should be deflated unless a compression mode is passed explicitly"""
+    from package_skill import SkillPackager
     
-    def test_custom_output_path(self):
-        """Should create package at custom path"""
-        output_path = Path(self.test_dir) / "custom" / "my-skill.zip"
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        packager = SkillPackager(str(self.skill_path), validate=False)
-        zip_path = packager.package(str(output_path))
-        
-        self.assertEqual(str(output_path), zip_path)
-        self.assertTrue(output_path.exists())
+    zip_path = SkillPackager(str(base_skill), validate=False).package(str(tmp_path / "out.zip"))
     
-    def test_nested_directory_structure(self):
-        """Should preserve nested directory structure"""
-        # Create nested structure
-        scripts_dir = self.skill_path / "scripts" / "utils"
-        scripts_dir.mkdir(parents=True)
-        (scripts_dir / "helper.py").write_text("def help(): pass")
-        
-        packager = SkillPackager(str(self.skill_path), validate=False)
-        zip_path = packager.package()
-        
-        # Verify nested structure is preserved
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            names = zf.namelist()
-            self.assertIn("scripts/utils/helper.py", names)
+    with zipfile.ZipFile(zip_path, 'r') as zf:
+        assert zf.getinfo("SKILL.md").compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_checksum_calculation(base_skill, make_packager):
+    """Should calculate checksums for files"""
+    packager = make_packager(base_skill)
+
+    # Test checksum calculation
+    checksum = packager._calculate_checksum(base_skill / "SKILL.md")
+
+    # Should match the digest of the fixture bytes and be stable across calls
+    assert checksum == SKILL_MD_SHA256
+    assert checksum == packager._calculate_checksum(base_skill / "SKILL.md")
+
+
+def test_checksum_tracks_file_changes(base_skill, make_packager):
+    """The checksum should follow the file's current content after a rewrite"""
+    packager = make_packager(base_skill)
+    skill_md = base_skill / "SKILL.md"
     
-    def test_excludes_hidden_files(self):
-        """Should exclude hidden files"""
-        (self.skill_path / ".gitignore").write_text("*.pyc")
-        (self.skill_path / ".hidden").write_text("hidden content")
-        
-        packager = SkillPackager(str(self.skill_path), validate=False)
-        zip_path = packager.package()
-        
-        # Verify hidden files are not in zip
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            names = zf.namelist()
-            hidden_files = [n for n in names if n.startswith('.')]
-            self.assertEqual(len(hidden_files), 0)
+    assert packager._calculate_checksum(skill_md) == SKILL_MD_SHA256
     
-    def test_manifest_includes_file_metadata(self):
-        """Manifest should include file metadata"""
-        # Create some files
-        scripts_dir = self.skill_path / "scripts"
-        scripts_dir.mkdir()
-        (scripts_dir / "script.py").write_text("print('hello')")
-        
-        packager = SkillPackager(str(self.skill_path), validate=False)
-        zip_path = packager.package()
-        
-        # Read manifest
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            manifest_content = zf.read("manifest.json")
-            manifest = json.loads(manifest_content)
-            
-            # Check SKILL.md metadata
-            self.assertIn("SKILL.md", manifest["files"])
-            self.assertIn("checksum", manifest["files"]["SKILL.md"])
-            self.assertIn("size", manifest["files"]["SKILL.md"])
-            
-            # Check scripts metadata
-            if "scripts" in manifest["files"]:
-                self.assertIsInstance(manifest["files"]["scripts"], dict)
-
-
-class TestPackageMultipleSkills(unittest.TestCase):
-    """Test batch packaging functionality"""
+    new_bytes = SKILL_MD_BYTES + b"\nMore content.\n"
+    skill_md.write_bytes(new_bytes)
     
-    def setUp(self):
-        """Create temporary directory with multiple skills"""
-        self.test_dir = tempfile.mkdtemp()
-        
-        # Create two skills
-        for i in range(1, 3):
-            skill_path = Path(self.test_dir) / f"skill-{i}"
-            skill_path.mkdir()
-            
-            skill_md = f"""---
+    assert packager._calculate_checksum(skill_md) == hashlib.sha256(new_bytes).hexdigest()
+
+
+def test_format_size(base_skill, make_packager):
+    """Should format file sizes correctly"""
+    packager = make_packager(base_skill)
+
+    assert "B" in packager._format_size(100)
+    assert "KB" in packager._format_size(2048)
+    assert "MB" in packager._format_size(2 * 1024 * 1024)
+
+
+def test_package_without_validation(packaged_base_zip):
+    """Should package without validation when validate=False"""
+    zip_path = packaged_base_zip
+
+    assert zip_path is not None
+    assert Path(zip_path).exists()
+
+
+def test_missing_skill_md_fails(base_skill, make_packager):
+    """Should fail if SKILL.md is missing"""
+    # Remove SKILL.md
+    (base_skill / "SKILL.md").unlink()
+
+    packager = make_packager(base_skill)
+
+    with pytest.raises(ValueError):
+        packager.package()
+
+
+def test_custom_output_path(base_skill, tmp_path, make_packager):
+    """Should create package at custom path"""
+    output_path = tmp_path / "custom" / "my-skill.zip"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    packager = make_packager(base_skill)
+    zip_path = packager.package(str(output_path))
+
+    assert str(output_path) == zip_path
+    assert output_path.exists()
+
+
+def test_nested_directory_structure(skill_tree, make_packager):
+    """Should preserve nested directory structure"""
+    skill_path = skill_tree({"scripts/utils/helper.py": "def help(): pass"})
+
+    packager = make_packager(skill_path)
+    zip_path = packager.package()
+
+    # Verify nested structure is preserved
+    names = _zip_names(zip_path)
+    assert "scripts/utils/helper.py" in names
+
+
+def test_excludes_hidden_files(skill_tree, make_packager):
+    """Should exclude hidden files"""
+    skill_path = skill_tree({".gitignore": "*.pyc", ".hidden": "hidden content"})
+
+    packager = make_packager(skill_path)
+    zip_path = packager.package()
+
+    # Verify hidden files are not in zip
+    names = _zip_names(zip_path)
+    hidden_files = [n for n in names if n.startswith('.')]
+    assert len(hidden_files) == 0
+
+
+def test_manifest_includes_file_metadata(skill_tree, make_packager):
+    """Manifest should include file metadata"""
+    skill_path = skill_tree({"scripts/script.py": "print('hello')"})
+
+    packager = make_packager(skill_path)
+    zip_path = packager.package()
+
+    # Read manifest
+    names, manifest = _read_package(zip_path)
+    assert "scripts/script.py" in names
+
+    # Check SKILL.md metadata
+    assert "SKILL.md" in manifest["files"]
+    assert "checksum" in manifest["files"]["SKILL.md"]
+    assert "size" in manifest["files"]["SKILL.md"]
+
+    # Check scripts metadata
+    if "scripts" in manifest["files"]:
+        assert isinstance(manifest["files"]["scripts"], dict)
+
+
+# Batch fixtures, encoded once at import so the fixture only writes bytes
+BATCH_SKILL_MDS = {
+    f"skill-{i}": f"""---
 name: skill-{i}
 description: Test skill {i} for batch packaging tests.
 license: MIT
@@ -309,27 +311,30 @@ license: MIT
 # Skill {i}
 
 Content for skill {i}.
-"""
-            (skill_path / "SKILL.md").write_text(skill_md)
-    
-    def tearDown(self):
-        """Clean up"""
-        shutil.rmtree(self.test_dir)
+""".encode('utf-8')
+    for i in range(1, 3)
+}
+
+
+@pytest.fixture
+def skills_dir(tmp_path):
+    """Create temporary directory with multiple skills"""
+    for name, content in BATCH_SKILL_MDS.items():
+        skill_path = tmp_path / name
+        skill_path.mkdir()
+        (skill_path / "SKILL.md").write_bytes(content)
+    return tmp_path
+
+
+def test_batch_packaging(skills_dir):
+    """Should package multiple skills"""
+    from package_skill import package_multiple_skills
     
-    def test_batch_packaging(self):
-        """Should package multiple skills"""
-        from package_skill import package_multiple_skills
-        
-        packaged = package_multiple_skills(self.test_dir)
-        
-        # Should have packaged 2 skills
-        self.assertEqual(len(packaged), 2)
-        
-        # All should exist
-        for zip_path in packaged:
-            self.assertTrue(Path(zip_path).exists())
-
-
-if __name__ == '__main__':
-    unittest.main()
+    packaged = package_multiple_skills(str(skills_dir))
+
+    # Should have packaged 2 skills
+    assert len(packaged) == 2
 
+    # All should exist
+    for zip_path in packaged:
+        assert Path(zip_path).exists()
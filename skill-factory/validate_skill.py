@@ -7,18 +7,36 @@ Usage:
     python validate_skill.py <skill_folder_path>
     python validate_skill.py <skill_folder_path> --strict
     python validate_skill.py <skill_folder_path> --verbose
+    python validate_skill.py <skill_folder_path> --cache
+    python validate_skill.py <skill_folder_path> <skill_folder_path> ...
 """
 
+import os
+import sys
+
+# SKILL_FACTORY_NO_PYC=1 stops the imports below from writing __pycache__
+# folders, e.g. for read-only installs or CI runs over many skills
+if os.environ.get('SKILL_FACTORY_NO_PYC'):
+    sys.dont_write_bytecode = True
+
 import re
 import ast
+import bisect
 import yaml
-import json
-import sys
+import functools
+import itertools
+import operator
 from pathlib import Path
-from typing import List, Tuple, Dict, Optional
+from typing import IO, Iterator, List, Tuple, Dict, Optional, NamedTuple, Union
 from dataclasses import dataclass
 from enum import Enum
 
+# Use the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 class Severity(Enum):
     ERROR = "ERROR"
@@ -35,14 +53,196 @@ class ValidationIssue:
     fix_suggestion: str = ""
     
     def __str__(self):
-        result = f"[{self.severity.value}] {self.message}"
+        parts = [f"[{self.severity.value}] {self.message}"]
         if self.location:
-            result += f"\n  Location: {self.location}"
+            parts.append(f"\n  Location: {self.location}")
             if self.line_number:
-                result += f" (line {self.line_number})"
+                parts.append(f" (line {self.line_number})")
         if self.fix_suggestion:
-            result += f"\n  Fix: {self.fix_suggestion}"
+            parts.append(f"\n  Fix: {self.fix_suggestion}")
+        return ''.join(parts)
+
+
+class ValidationResult(tuple):
+    """
+    Outcome of SkillValidator.validate()
+    Unpacks as (is_valid, issues); errors, warnings and infos hold the issues split by severity
+    """
+    
+    def __new__(cls, issues: List[ValidationIssue]):
+        buckets = {Severity.ERROR: [], Severity.WARNING: [], Severity.INFO: []}
+        for issue in issues:
+            buckets[issue.severity].append(issue)
+        
+        result = super().__new__(cls, (not buckets[Severity.ERROR], issues))
+        result.errors = buckets[Severity.ERROR]
+        result.warnings = buckets[Severity.WARNING]
+        result.infos = buckets[Severity.INFO]
         return result
+    
+    def __getnewargs__(self):
+        # copy and pickle rebuild through __new__, which takes the issues rather than the tuple items
+        return (self.issues,)
+    
+    @property
+    def is_valid(self) -> bool:
+        return self[0]
+    
+    @property
+    def issues(self) -> List[ValidationIssue]:
+        return self[1]
+
+
+# Text files larger than this are not scanned for placeholders or secrets
+MAX_SCAN_BYTES = 1024 * 1024
+
+# Secrets matches reported per rule per file; further matches are summarised in one issue
+MAX_MATCHES_PER_PATTERN = 5
+
+
+class _ScriptAnalysis(NamedTuple):
+    """What the script checks need to know about one .py file"""
+    syntax_error: Optional[SyntaxError]
+    has_docstring: bool = False
+    has_try_except: bool = False
+    has_main_guard: bool = False
+
+
+# try/except blocks, including except* on Python 3.11+
+_TRY_NODES = (ast.Try, ast.TryStar) if hasattr(ast, 'TryStar') else (ast.Try,)
+
+
+def _is_main_guard(test: ast.expr) -> bool:
+    """True for the test of `if __name__ == '__main__':` (either operand order)"""
+    if not (isinstance(test, ast.Compare) and len(test.ops) == 1 and isinstance(test.ops[0], ast.Eq)):
+        return False
+    operands = (test.left, test.comparators[0])
+    return (
+        any(isinstance(op, ast.Name) and op.id == '__name__' for op in operands) and
+        any(isinstance(op, ast.Constant) and op.value == '__main__' for op in operands)
+    )
+
+
+def _analyze_python_file(path: str) -> _ScriptAnalysis:
+    """Read, parse and inspect a script once for all of the script checks"""
+    content = Path(path).read_text(encoding='utf-8')
+    try:
+        tree = ast.parse(content, filename=path)
+    except SyntaxError as e:
+        return _ScriptAnalysis(syntax_error=e)
+    
+    has_docstring = (
+        isinstance(tree.body[0], ast.Expr) and
+        isinstance(tree.body[0].value, (ast.Str, ast.Constant))
+    ) if tree.body else False
+    
+    # One walk finds both; stop as soon as both have been seen
+    has_try_except = has_main_guard = False
+    for node in ast.walk(tree):
+        if isinstance(node, _TRY_NODES):
+            has_try_except = True
+        elif isinstance(node, ast.If) and _is_main_guard(node.test):
+            has_main_guard = True
+        if has_try_except and has_main_guard:
+            break
+    
+    return _ScriptAnalysis(None, has_docstring, has_try_except, has_main_guard)
+
+
+_NEWLINE_REGEX = re.compile('\n')
+_NEWLINE_BYTES_REGEX = re.compile(b'\n')
+
+
+def _line_starts(text) -> List[int]:
+    """Offsets at which each line of text (str or bytes) begins, for use with _line_number"""
+    newline_regex = _NEWLINE_BYTES_REGEX if isinstance(text, bytes) else _NEWLINE_REGEX
+    line_starts = [0]
+    line_starts.extend(match.end() for match in newline_regex.finditer(text))
+    return line_starts
+
+
+def _line_number(line_starts: List[int], offset: int) -> int:
+    """1-based line containing offset, by binary search instead of counting newlines"""
+    return bisect.bisect_right(line_starts, offset)
+
+
+class _LazyLineIndex:
+    """
+    Line lookups for one file's text (str or bytes)
+    finditer yields increasing offsets, so lookups normally just count the newlines since the
+    previous one; the bisect index is only built if a lookup moves backwards (e.g. a new rule)
+    """
+    
+    __slots__ = ('text', 'newline', 'line_starts', 'pos', 'line')
+    
+    def __init__(self, text):
+        self.text = text
+        self.newline = b'\n' if isinstance(text, bytes) else '\n'
+        self.line_starts: Optional[List[int]] = None
+        self.pos = 0
+        self.line = 1
+    
+    def line_number(self, offset: int) -> int:
+        if self.line_starts is not None:
+            return _line_number(self.line_starts, offset)
+        if offset < self.pos:
+            self.line_starts = _line_starts(self.text)
+            return _line_number(self.line_starts, offset)
+        self.line += self.text.count(self.newline, self.pos, offset)
+        self.pos = offset
+        return self.line
+
+
+# One "key: value" frontmatter line whose value is a plain (unquoted, single-line) YAML scalar
+_SIMPLE_FRONTMATTER_LINE = re.compile(r'([A-Za-z_][A-Za-z0-9_-]*):[ ]+([^\s\-?:,\[\]{}#&*!|>\'"%@`][^\t]*?)[ ]*')
+_YAML_STR_TAG = 'tag:yaml.org,2002:str'
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_resolver() -> yaml.resolver.Resolver:
+    """Resolver holding PyYAML's implicit scalar rules (bool, int, float, null, timestamp)"""
+    return yaml.resolver.Resolver()
+
+
+@functools.lru_cache(maxsize=None)
+def _validator_fingerprint() -> str:
+    """
+    Hash of this module's own code and the PyYAML version, so --cache results from
+    any other version of the rules or parser are never reused
+    """
+    import hashlib
+    try:
+        code = Path(__file__).read_bytes()
+    except OSError:
+        # Inside a zipapp __file__ names an archive member, which only the loader can read
+        code = __loader__.get_data(__file__)
+    return hashlib.sha1(code + b"\0" + yaml.__version__.encode('ascii')).hexdigest()
+
+
+def _parse_frontmatter(text: str):
+    """
+    Parse SKILL.md frontmatter, skipping PyYAML for the usual flat block of string values
+    Anything it is not sure about (nesting, lists, quoting, comments, block scalars or a value
+    YAML would read as a bool/number/null/date) is handed to yaml.load unchanged, so results
+    and YAMLErrors are the same as parsing everything with PyYAML
+    """
+    resolver = _yaml_resolver()
+    frontmatter = {}
+    # Only '\n': text is newline-normalised already, and splitlines() would also break on
+    # \x0b, \x0c and \x1c-\x1e, which PyYAML rejects rather than treats as line ends
+    for line in text.split('\n'):
+        if not line.strip():
+            continue
+        match = _SIMPLE_FRONTMATTER_LINE.fullmatch(line) if line.isprintable() else None
+        if match is None:
+            return yaml.load(text, Loader=YamlLoader)
+        key, value = match.groups()
+        if (': ' in value or ' #' in value or value.endswith(':') or
+                resolver.resolve(yaml.ScalarNode, key, (True, False)) != _YAML_STR_TAG or
+                resolver.resolve(yaml.ScalarNode, value, (True, False)) != _YAML_STR_TAG):
+            return yaml.load(text, Loader=YamlLoader)
+        frontmatter[key] = value
+    return frontmatter or yaml.load(text, Loader=YamlLoader)
 
 
 class SkillValidator:
@@ -79,16 +279,104 @@ class SkillValidator:
         (r'["\']?access_token["\']?\s*[:=]\s*["\'][^"\']+["\']', "Access token"),
     ]
     
-    def __init__(self, skill_path: str):
+    # Fixed patterns used by the checks below, compiled once at class creation
+    SKILL_NAME_REGEX = re.compile(r'^[a-z0-9]+(?:-[a-z0-9]+)*$')
+    SECOND_PERSON_REGEX = re.compile(r'\byou\b|\byour\b', re.IGNORECASE)
+    # bytes, like SECRETS_REGEXES: the text scans run on raw file contents without decoding
+    PLACEHOLDER_REGEX = re.compile(rb'\[(?:YOUR|FILL|INSERT|DESCRIBE|REPLACE|TODO|FIXME)[_\s][^\]]*\]', re.IGNORECASE)
+    
+    # The rule tables above, compiled once at class creation with the flags each check uses
+    REQUIRED_SECTION_REGEXES = [(re.compile(p, re.MULTILINE), description) for p, description in REQUIRED_SECTION_PATTERNS]
+    SECRETS_REGEXES = [(re.compile(p.encode('ascii'), re.IGNORECASE), description) for p, description in SECRETS_PATTERNS]
+    
+    # A fixed (lowercased) substring of each SECRETS_PATTERNS rule, in the same order; a rule
+    # can only match text that contains its literal
+    SECRETS_LITERALS = (b'api', b'password', b'secret', b'_live_', b'ghp_', b'xox', b'akia', b'access_token')
+    
+    # All FORBIDDEN_PATTERNS fused into one pass; each rule sits in a lookahead named
+    # rule<i>, so matches never consume text and rules can overlap as they did when
+    # checked one by one. FORBIDDEN_RULES maps the group name back to (name, fix).
+    FORBIDDEN_REGEX = re.compile(
+        '|'.join(f'(?=(?P<rule{i}>{p}))' for i, (p, _, _) in enumerate(FORBIDDEN_PATTERNS)),
+        re.IGNORECASE
+    )
+    FORBIDDEN_RULES = {f'rule{i}': (name, fix) for i, (_, name, fix) in enumerate(FORBIDDEN_PATTERNS)}
+    
+    def __init__(self, skill_path: Union[str, Path], cache_path: Optional[str] = None):
         self.skill_path = Path(skill_path)
         self.skill_md_path = self.skill_path / "SKILL.md"
         self.issues: List[ValidationIssue] = []
+        self.cache_path = cache_path
+        self.has_run = False
+        self._files_by_ext: Optional[Dict[str, List[Path]]] = None
+        self._file_cache: Dict[Path, bytes] = {}
+        self._root_entries_cache: Optional[Dict[str, os.DirEntry]] = None
     
-    def validate(self) -> Tuple[bool, List[ValidationIssue]]:
+    def validate(self) -> 'ValidationResult':
         """
         Run all validations on the skill
-        Returns: (is_valid, list_of_issues)
+        Returns: ValidationResult, which unpacks as (is_valid, list_of_issues)
+        """
+        self.has_run = True
+        cache_key = self._cache_key() if self.cache_path else None
+        if cache_key is not None:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                self.issues.extend(cached)
+                return ValidationResult(self.issues)
+        
+        _, issues = self._run_validations()
+        
+        if cache_key is not None and not any(i.message.startswith("Unexpected error") for i in issues):
+            self._cache_put(cache_key, issues)
+        return ValidationResult(issues)
+    
+    def _cache_key(self) -> Optional[str]:
+        """
+        Fingerprint of everything validation looks at: validator code, skill location,
+        the relative path of every folder (empty ones change validation too), and the
+        relative path and bytes of every file in the skill
+        Returns: Hex digest, or None if the skill cannot be read
         """
+        if not self.skill_path.is_dir():
+            return None
+        import hashlib
+        digest = hashlib.sha1(f"{_validator_fingerprint()}\0{self.skill_path.resolve()}".encode('utf-8'))
+        try:
+            for root, dirs, files in os.walk(self.skill_path):
+                dirs.sort()
+                for name in dirs:
+                    dir_path = Path(root) / name
+                    digest.update(b"\0d\0" + str(dir_path.relative_to(self.skill_path)).encode('utf-8'))
+                for name in sorted(files):
+                    file_path = Path(root) / name
+                    digest.update(b"\0" + str(file_path.relative_to(self.skill_path)).encode('utf-8') + b"\0")
+                    digest.update(file_path.read_bytes())
+        except OSError:
+            return None
+        return digest.hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[List[ValidationIssue]]:
+        """Cached issues for key; cache problems are treated as a miss"""
+        import shelve
+        try:
+            with shelve.open(self.cache_path, flag='c') as db:
+                return db.get(key)
+        except Exception:
+            return None
+    
+    def _cache_put(self, key: str, issues: List[ValidationIssue]):
+        """Store issues for key; failing to write the cache never fails validation"""
+        import shelve
+        try:
+            Path(self.cache_path).parent.mkdir(parents=True, exist_ok=True)
+            with shelve.open(self.cache_path, flag='c') as db:
+                db[key] = list(issues)
+        except Exception:
+            pass
+    
+    def _run_validations(self) -> Tuple[bool, List[ValidationIssue]]:
+        """Run every check and collect issues"""
         try:
             # Check skill_path exists and is directory
             if not self.skill_path.exists():
@@ -121,8 +409,7 @@ class SkillValidator:
             self._validate_skill_md()
             self._validate_file_structure()
             self._validate_python_scripts()
-            self._validate_content_quality()
-            self._check_for_secrets()
+            self._scan_text_files()
             
             # Check if there are any errors
             has_errors = any(issue.severity == Severity.ERROR for issue in self.issues)
@@ -141,7 +428,7 @@ class SkillValidator:
         """Validate SKILL.md structure and formatting"""
         try:
             # Read SKILL.md content
-            content = self.skill_md_path.read_text(encoding='utf-8')
+            content = self._read_text(self.skill_md_path)
             
             # Check starts with "---\n" (YAML frontmatter)
             if not content.startswith('---\n'):
@@ -171,7 +458,7 @@ class SkillValidator:
                 body = parts[2]
                 
                 # Parse YAML
-                frontmatter = yaml.safe_load(frontmatter_text)
+                frontmatter = _parse_frontmatter(frontmatter_text)
                 
                 if frontmatter is None:
                     self.issues.append(ValidationIssue(
@@ -202,7 +489,7 @@ class SkillValidator:
                             location="SKILL.md (frontmatter)",
                             fix_suggestion="Set name to a lowercase string with hyphens (e.g., 'my-skill')"
                         ))
-                    elif not re.match(r'^[a-z0-9]+(?:-[a-z0-9]+)*$', name):
+                    elif not self.SKILL_NAME_REGEX.match(name):
                         self.issues.append(ValidationIssue(
                             severity=Severity.WARNING,
                             message=f"Skill name '{name}' should use lowercase and hyphens only",
@@ -238,7 +525,7 @@ class SkillValidator:
                             ))
                         
                         # Check for second-person in description
-                        if re.search(r'\byou\b|\byour\b', desc, re.IGNORECASE):
+                        if self.SECOND_PERSON_REGEX.search(desc):
                             self.issues.append(ValidationIssue(
                                 severity=Severity.ERROR,
                                 message="Description contains second-person pronouns (you/your)",
@@ -247,8 +534,8 @@ class SkillValidator:
                             ))
                 
                 # Check for required markdown sections in body
-                for pattern, description in self.REQUIRED_SECTION_PATTERNS:
-                    if not re.search(pattern, body, re.MULTILINE):
+                for regex, description in self.REQUIRED_SECTION_REGEXES:
+                    if not regex.search(body):
                         self.issues.append(ValidationIssue(
                             severity=Severity.WARNING,
                             message=f"Missing recommended section: {description}",
@@ -256,16 +543,27 @@ class SkillValidator:
                             fix_suggestion=f"Add a section for {description}"
                         ))
                 
-                # Check for forbidden patterns
-                lines = body.split('\n')
-                for line_num, line in enumerate(lines, 1):
-                    for pattern, name, fix in self.FORBIDDEN_PATTERNS:
-                        if re.search(pattern, line, re.IGNORECASE):
+                # Check for forbidden patterns in one pass over the body, grouping the
+                # rules that fire by line (line_starts holds each line's start offset)
+                line_starts = _line_starts(body)
+                found_by_line: Dict[int, set] = {}
+                for match in self.FORBIDDEN_REGEX.finditer(body):
+                    line_index = _line_number(line_starts, match.start()) - 1
+                    found_by_line.setdefault(line_index, set()).add(match.lastgroup)
+                
+                first_body_line = frontmatter_text.count('\n') + 3
+                for line_index in sorted(found_by_line):
+                    found = found_by_line[line_index]
+                    start = line_starts[line_index]
+                    end = line_starts[line_index + 1] - 1 if line_index + 1 < len(line_starts) else len(body)
+                    line = body[start:end]
+                    for group, (name, fix) in self.FORBIDDEN_RULES.items():
+                        if group in found:
                             self.issues.append(ValidationIssue(
                                 severity=Severity.ERROR if 'you' in name.lower() else Severity.WARNING,
                                 message=f"Found {name}: '{line.strip()[:50]}...'",
                                 location="SKILL.md",
-                                line_number=line_num + frontmatter_text.count('\n') + 2,
+                                line_number=first_body_line + line_index,
                                 fix_suggestion=fix
                             ))
                 
@@ -307,7 +605,7 @@ class SkillValidator:
         try:
             # Check folder name uses lowercase and hyphens
             folder_name = self.skill_path.name
-            if not re.match(r'^[a-z0-9]+(?:-[a-z0-9]+)*$', folder_name):
+            if not self.SKILL_NAME_REGEX.match(folder_name):
                 self.issues.append(ValidationIssue(
                     severity=Severity.WARNING,
                     message=f"Skill folder name '{folder_name}' should use lowercase and hyphens only",
@@ -320,21 +618,22 @@ class SkillValidator:
                                    'LICENSE.txt', 'LICENSE', 'README.md', 'manifest.json', 
                                    '.gitignore', folder_name + '.zip'}
             
-            for item in self.skill_path.iterdir():
-                if item.name.startswith('.'):
+            root_entries = self._root_entries()
+            for name, entry in root_entries.items():
+                if name.startswith('.'):
                     continue  # Hidden files are okay
-                if item.name not in expected_root_items:
+                if name not in expected_root_items:
                     self.issues.append(ValidationIssue(
                         severity=Severity.INFO,
-                        message=f"Unexpected item in skill root: {item.name}",
-                        location=str(item),
+                        message=f"Unexpected item in skill root: {name}",
+                        location=entry.path,
                         fix_suggestion="Only include: SKILL.md, scripts/, references/, assets/, TESTING_GUIDE/, LICENSE.txt"
                     ))
             
             # Validate scripts/ folder
             scripts_dir = self.skill_path / "scripts"
-            if scripts_dir.exists():
-                if not scripts_dir.is_dir():
+            if 'scripts' in root_entries:
+                if not root_entries['scripts'].is_dir():
                     self.issues.append(ValidationIssue(
                         severity=Severity.ERROR,
                         message="'scripts' exists but is not a directory",
@@ -342,7 +641,7 @@ class SkillValidator:
                         fix_suggestion="Remove the file and create a directory if scripts are needed"
                     ))
                 else:
-                    py_files = list(scripts_dir.glob("*.py"))
+                    py_files = self._dir_files(scripts_dir, ('.py',))
                     if not py_files:
                         self.issues.append(ValidationIssue(
                             severity=Severity.WARNING,
@@ -353,8 +652,8 @@ class SkillValidator:
             
             # Validate references/ folder
             references_dir = self.skill_path / "references"
-            if references_dir.exists():
-                if not references_dir.is_dir():
+            if 'references' in root_entries:
+                if not root_entries['references'].is_dir():
                     self.issues.append(ValidationIssue(
                         severity=Severity.ERROR,
                         message="'references' exists but is not a directory",
@@ -362,7 +661,7 @@ class SkillValidator:
                         fix_suggestion="Remove the file and create a directory if references are needed"
                     ))
                 else:
-                    doc_files = list(references_dir.glob("*.md")) + list(references_dir.glob("*.txt"))
+                    doc_files = self._dir_files(references_dir, ('.md', '.txt'))
                     if not doc_files:
                         self.issues.append(ValidationIssue(
                             severity=Severity.INFO,
@@ -373,7 +672,7 @@ class SkillValidator:
             
             # Validate assets/ folder
             assets_dir = self.skill_path / "assets"
-            if assets_dir.exists() and not assets_dir.is_dir():
+            if 'assets' in root_entries and not root_entries['assets'].is_dir():
                 self.issues.append(ValidationIssue(
                     severity=Severity.ERROR,
                     message="'assets' exists but is not a directory",
@@ -382,8 +681,7 @@ class SkillValidator:
                 ))
             
             # Check TESTING_GUIDE exists (info only)
-            testing_guide_dir = self.skill_path / "TESTING_GUIDE"
-            if not testing_guide_dir.exists():
+            if 'TESTING_GUIDE' not in root_entries:
                 self.issues.append(ValidationIssue(
                     severity=Severity.INFO,
                     message="No TESTING_GUIDE/ folder found",
@@ -400,70 +698,18 @@ class SkillValidator:
     
     def _validate_python_scripts(self):
         """Validate Python scripts if present"""
-        scripts_dir = self.skill_path / "scripts"
-        if not scripts_dir.exists():
-            return
-        
         try:
-            py_files = list(scripts_dir.glob("*.py"))
+            scripts_entry = self._root_entries().get('scripts')
+            if scripts_entry is None or not scripts_entry.is_dir():
+                # A non-directory 'scripts' is reported by _validate_file_structure
+                return
+            scripts_dir = self.skill_path / "scripts"
+            
+            py_files = self._dir_files(scripts_dir, ('.py',))
             
             for py_file in py_files:
                 try:
-                    content = py_file.read_text(encoding='utf-8')
-                    
-                    # Check Python syntax
-                    try:
-                        ast.parse(content)
-                    except SyntaxError as e:
-                        self.issues.append(ValidationIssue(
-                            severity=Severity.ERROR,
-                            message=f"Python syntax error in {py_file.name}",
-                            location=str(py_file),
-                            line_number=e.lineno,
-                            fix_suggestion=f"Fix syntax error: {str(e)}"
-                        ))
-                        continue
-                    
-                    # Check for module docstring
-                    tree = ast.parse(content)
-                    has_docstring = (
-                        isinstance(tree.body[0], ast.Expr) and
-                        isinstance(tree.body[0].value, (ast.Str, ast.Constant))
-                    ) if tree.body else False
-                    
-                    if not has_docstring:
-                        self.issues.append(ValidationIssue(
-                            severity=Severity.WARNING,
-                            message=f"Missing module docstring in {py_file.name}",
-                            location=str(py_file),
-                            fix_suggestion="Add a docstring at the top explaining what the script does"
-                        ))
-                    
-                    # Check for error handling
-                    has_try_except = any(
-                        isinstance(node, ast.Try) or isinstance(node, ast.ExceptHandler)
-                        for node in ast.walk(tree)
-                    )
-                    
-                    if not has_try_except:
-                        self.issues.append(ValidationIssue(
-                            severity=Severity.WARNING,
-                            message=f"No error handling (try/except) found in {py_file.name}",
-                            location=str(py_file),
-                            fix_suggestion="Add try/except blocks for robust error handling"
-                        ))
-                    
-                    # Check for __main__ guard
-                    has_main_guard = '__name__' in content and '__main__' in content
-                    
-                    if not has_main_guard:
-                        self.issues.append(ValidationIssue(
-                            severity=Severity.INFO,
-                            message=f"No __main__ guard in {py_file.name}",
-                            location=str(py_file),
-                            fix_suggestion="Add: if __name__ == '__main__': main()"
-                        ))
-                        
+                    analysis = _analyze_python_file(str(py_file))
                 except Exception as e:
                     self.issues.append(ValidationIssue(
                         severity=Severity.ERROR,
@@ -471,6 +717,46 @@ class SkillValidator:
                         location=str(py_file),
                         fix_suggestion="Ensure file is readable and properly encoded"
                     ))
+                    continue
+                
+                # Check Python syntax
+                e = analysis.syntax_error
+                if e is not None:
+                    self.issues.append(ValidationIssue(
+                        severity=Severity.ERROR,
+                        message=f"Python syntax error in {py_file.name}",
+                        location=str(py_file),
+                        line_number=e.lineno,
+                        fix_suggestion=f"Fix syntax error: {str(e)}"
+                    ))
+                    continue
+                
+                # Check for module docstring
+                if not analysis.has_docstring:
+                    self.issues.append(ValidationIssue(
+                        severity=Severity.WARNING,
+                        message=f"Missing module docstring in {py_file.name}",
+                        location=str(py_file),
+                        fix_suggestion="Add a docstring at the top explaining what the script does"
+                    ))
+                
+                # Check for error handling
+                if not analysis.has_try_except:
+                    self.issues.append(ValidationIssue(
+                        severity=Severity.WARNING,
+                        message=f"No error handling (try/except) found in {py_file.name}",
+                        location=str(py_file),
+                        fix_suggestion="Add try/except blocks for robust error handling"
+                    ))
+                
+                # Check for __main__ guard
+                if not analysis.has_main_guard:
+                    self.issues.append(ValidationIssue(
+                        severity=Severity.INFO,
+                        message=f"No __main__ guard in {py_file.name}",
+                        location=str(py_file),
+                        fix_suggestion="Add: if __name__ == '__main__': main()"
+                    ))
                     
         except Exception as e:
             self.issues.append(ValidationIssue(
@@ -479,92 +765,164 @@ class SkillValidator:
                 fix_suggestion="Check scripts/ directory permissions"
             ))
     
-    def _validate_content_quality(self):
-        """Check content quality across all text files"""
+    def _root_entries(self) -> Dict[str, os.DirEntry]:
+        """Entries of the skill root from a single scandir, keyed by name; DirEntry caches is_dir()"""
+        if self._root_entries_cache is None:
+            with os.scandir(self.skill_path) as it:
+                self._root_entries_cache = {entry.name: entry for entry in it}
+        return self._root_entries_cache
+    
+    def _dir_files(self, directory: Path, suffixes: Tuple[str, ...]) -> List[Path]:
+        """Files directly inside directory ending in one of the lowercase suffixes, in any case (scandir, no glob matching)"""
+        with os.scandir(directory) as it:
+            return [Path(entry.path) for entry in it if entry.name.lower().endswith(suffixes) and entry.is_file()]
+    
+    def _read_bytes(self, path: Path) -> bytes:
+        """Read a file once per validation; SKILL.md is read by several checks"""
+        data = self._file_cache.get(path)
+        if data is None:
+            data = self._file_cache[path] = path.read_bytes()
+        return data
+    
+    def _read_text(self, path: Path) -> str:
+        """Decode a cached file as UTF-8 with universal newlines, as Path.read_text would"""
+        return self._read_bytes(path).decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    
+    def _collect_files(self) -> Dict[str, List[Path]]:
+        """
+        Walk the skill once (skipping TESTING_GUIDE/) and bucket files by lowercased extension
+        Returns: {'.md': [...], '.py': [...], ...}, reused by every scan that needs it
+        """
+        if self._files_by_ext is None:
+            files_by_ext: Dict[str, List[Path]] = {}
+            for root, dirs, files in os.walk(self.skill_path):
+                # Prune rather than filter, so TESTING_GUIDE/ is never descended into
+                dirs[:] = [d for d in dirs if d != 'TESTING_GUIDE']
+                root_path = Path(root)
+                for name in files:
+                    # Lowercased so NOTES.MD or CONFIG.JSON are scanned too, as on Windows
+                    ext = os.path.splitext(name)[1].lower()
+                    files_by_ext.setdefault(ext, []).append(root_path / name)
+            self._files_by_ext = files_by_ext
+        return self._files_by_ext
+    
+    def _text_files(self, extensions: Tuple[str, ...]) -> List[Path]:
+        """Files under the skill with any of the given extensions, grouped in that order"""
+        files_by_ext = self._collect_files()
+        return [f for ext in extensions for f in files_by_ext.get(ext, ())]
+    
+    # Extensions covered by each text scan; secrets are checked in config files too
+    PLACEHOLDER_SCAN_EXTENSIONS = ('.md', '.txt', '.py')
+    SECRETS_SCAN_EXTENSIONS = ('.md', '.txt', '.py', '.yaml', '.yml', '.json')
+    
+    def _scan_text_files(self):
+        """Read each text file once and run both the placeholder and the secrets scan on it"""
+        placeholder_issues: List[ValidationIssue] = []
+        secret_issues: List[ValidationIssue] = []
         try:
-            # Scan all .md, .txt, .py files (excluding TESTING_GUIDE)
-            text_files = []
-            for pattern in ['*.md', '*.txt', '*.py']:
-                for f in self.skill_path.rglob(pattern):
-                    # Skip TESTING_GUIDE directory
-                    if 'TESTING_GUIDE' in f.parts:
-                        continue
-                    text_files.append(f)
-            
-            placeholder_pattern = r'\[(?:YOUR|FILL|INSERT|DESCRIBE|REPLACE|TODO|FIXME)[_\s][^\]]*\]'
-            
-            for text_file in text_files:
+            # SECRETS_SCAN_EXTENSIONS is a superset of PLACEHOLDER_SCAN_EXTENSIONS (excluding TESTING_GUIDE)
+            for text_file in self._text_files(self.SECRETS_SCAN_EXTENSIONS):
                 try:
-                    content = text_file.read_text(encoding='utf-8')
-                    
-                    # Check for placeholder text patterns
-                    matches = re.finditer(placeholder_pattern, content, re.IGNORECASE)
-                    for match in matches:
-                        # Get line number
-                        line_num = content[:match.start()].count('\n') + 1
+                    size = text_file.stat().st_size
+                    if size > MAX_SCAN_BYTES:
                         self.issues.append(ValidationIssue(
-                            severity=Severity.WARNING,
-                            message=f"Placeholder text found: {match.group()[:50]}",
+                            severity=Severity.INFO,
+                            message=f"Skipped scanning large file {text_file.name} ({size / (1024 * 1024):.1f} MB)",
                             location=str(text_file.relative_to(self.skill_path)),
-                            line_number=line_num,
-                            fix_suggestion="Replace placeholder with actual content"
+                            fix_suggestion="Review it manually for placeholders and secrets, or move it out of the skill"
                         ))
-                        
-                except Exception:
-                    # Skip files that can't be read as text
-                    pass
+                        continue
                     
+                    content = self._read_bytes(text_file)
+                    if b'\x00' in content[:4096]:
+                        # NUL bytes mean binary content despite the extension
+                        continue
+                except Exception:
+                    # Skip files that can't be read
+                    continue
+                
+                line_index = _LazyLineIndex(content)
+                location = str(text_file.relative_to(self.skill_path))
+                if text_file.suffix.lower() in self.PLACEHOLDER_SCAN_EXTENSIONS:
+                    placeholder_issues.extend(self._scan_placeholders(content, location, line_index))
+                secret_issues.extend(self._scan_secrets(content, location, text_file.name, line_index))
+        
         except Exception as e:
             self.issues.append(ValidationIssue(
                 severity=Severity.WARNING,
-                message=f"Error checking content quality: {str(e)}",
+                message=f"Error scanning text files: {str(e)}",
                 fix_suggestion="Manual review recommended"
             ))
+        
+        # Content quality findings are reported ahead of security findings
+        self.issues.extend(placeholder_issues)
+        self.issues.extend(secret_issues)
     
-    def _check_for_secrets(self):
+    def _scan_placeholders(self, content: bytes, location: str, line_index: '_LazyLineIndex') -> List[ValidationIssue]:
+        """Check content quality: placeholder text left in a file"""
+        return [
+            ValidationIssue(
+                severity=Severity.WARNING,
+                message=f"Placeholder text found: {match.group().decode('utf-8', 'replace')[:50]}",
+                location=location,
+                line_number=line_index.line_number(match.start()),
+                fix_suggestion="Replace placeholder with actual content"
+            )
+            for match in self.PLACEHOLDER_REGEX.finditer(content)
+        ]
+    
+    def _scan_secrets(self, content: bytes, location: str, file_name: str, line_index: '_LazyLineIndex') -> List[ValidationIssue]:
         """Scan for hardcoded secrets or sensitive information"""
-        try:
-            # Scan all text files (exclude TESTING_GUIDE/)
-            text_files = []
-            for pattern in ['*.md', '*.txt', '*.py', '*.yaml', '*.yml', '*.json']:
-                for f in self.skill_path.rglob(pattern):
-                    # Skip TESTING_GUIDE directory
-                    if 'TESTING_GUIDE' in f.parts:
-                        continue
-                    text_files.append(f)
+        # Substring checks are far cheaper than the regexes; only rules whose literal
+        # occurs in the text are run, and most files need none of them
+        lowered = content.lower()
+        candidates = [
+            rule for rule, literal in zip(self.SECRETS_REGEXES, self.SECRETS_LITERALS)
+            if literal in lowered
+        ]
+        
+        issues = []
+        for regex, description in candidates:
+            matches = regex.finditer(content)
+            for match in itertools.islice(matches, MAX_MATCHES_PER_PATTERN):
+                issues.append(ValidationIssue(
+                    severity=Severity.ERROR,
+                    message=f"{description} detected in {file_name}",
+                    location=location,
+                    line_number=line_index.line_number(match.start()),
+                    fix_suggestion="Remove hardcoded secrets - use environment variables or configuration instead"
+                ))
             
-            for text_file in text_files:
-                try:
-                    content = text_file.read_text(encoding='utf-8')
-                    
-                    # Check against SECRETS_PATTERNS
-                    for pattern, description in self.SECRETS_PATTERNS:
-                        matches = re.finditer(pattern, content, re.IGNORECASE)
-                        for match in matches:
-                            line_num = content[:match.start()].count('\n') + 1
-                            self.issues.append(ValidationIssue(
-                                severity=Severity.ERROR,
-                                message=f"{description} detected in {text_file.name}",
-                                location=str(text_file.relative_to(self.skill_path)),
-                                line_number=line_num,
-                                fix_suggestion="Remove hardcoded secrets - use environment variables or configuration instead"
-                            ))
-                            
-                except Exception:
-                    # Skip binary files or files that can't be read
-                    pass
-                    
-        except Exception as e:
-            self.issues.append(ValidationIssue(
-                severity=Severity.WARNING,
-                message=f"Error checking for secrets: {str(e)}",
-                fix_suggestion="Manual security review recommended"
-            ))
+            # Stop at the cap; one more match is enough to know the file has others
+            if next(matches, None) is not None:
+                issues.append(ValidationIssue(
+                    severity=Severity.ERROR,
+                    message=f"{description}: more than {MAX_MATCHES_PER_PATTERN} matches in {file_name}, only the first {MAX_MATCHES_PER_PATTERN} are listed",
+                    location=location,
+                    fix_suggestion="Remove hardcoded secrets - use environment variables or configuration instead"
+                ))
+        return issues
     
-    def generate_report(self, verbose: bool = False) -> str:
-        """Generate human-readable validation report"""
+    def generate_report(self, verbose: bool = False, out: Optional[IO[str]] = None) -> Optional[str]:
+        """
+        Generate human-readable validation report (runs validate() first if it has not run yet)
+        Returns the report, or writes it to out line by line (as print would) and returns None
+        """
+        if not self.has_run:
+            self.validate()
+        
+        lines = self._report_lines(verbose)
+        if out is None:
+            return '\n'.join(lines)
+        for line in lines:
+            out.write(line)
+            out.write('\n')
+        return None
+    
+    def _report_lines(self, verbose: bool) -> Iterator[str]:
+        """Yield the report one line (or block) at a time"""
         if not self.issues:
-            return f"""
+            yield f"""
 {'='*70}
 ✓ VALIDATION PASSED
 {'='*70}
@@ -574,136 +932,262 @@ Path: {self.skill_path}
 
 No issues found! This skill meets all validation requirements.
 """
+            return
         
         # Count errors, warnings, info
-        errors = [i for i in self.issues if i.severity == Severity.ERROR]
-        warnings = [i for i in self.issues if i.severity == Severity.WARNING]
-        infos = [i for i in self.issues if i.severity == Severity.INFO]
+        result = ValidationResult(self.issues)
+        errors, warnings, infos = result.errors, result.warnings, result.infos
         
         # Build report
-        lines = []
-        lines.append('='*70)
+        yield '='*70
         
         if errors:
-            lines.append('✗ VALIDATION FAILED')
+            yield '✗ VALIDATION FAILED'
         else:
-            lines.append('⚠ VALIDATION PASSED WITH WARNINGS')
+            yield '⚠ VALIDATION PASSED WITH WARNINGS'
         
-        lines.append('='*70)
-        lines.append(f"\nSkill: {self.skill_path.name}")
-        lines.append(f"Path: {self.skill_path}\n")
+        yield '='*70
+        yield f"\nSkill: {self.skill_path.name}"
+        yield f"Path: {self.skill_path}\n"
         
         # Status summary
-        lines.append("Summary:")
-        lines.append(f"  Errors:   {len(errors)}")
-        lines.append(f"  Warnings: {len(warnings)}")
-        lines.append(f"  Info:     {len(infos)}")
-        lines.append("")
+        yield "Summary:"
+        yield f"  Errors:   {len(errors)}"
+        yield f"  Warnings: {len(warnings)}"
+        yield f"  Info:     {len(infos)}"
+        yield ""
         
         # Errors section (always show)
         if errors:
-            lines.append('-'*70)
-            lines.append('ERRORS (must be fixed):')
-            lines.append('-'*70)
+            yield from ('-'*70, 'ERRORS (must be fixed):', '-'*70)
             for i, issue in enumerate(errors, 1):
-                lines.append(f"\n{i}. {issue}\n")
+                yield f"\n{i}. {issue}\n"
         
         # Warnings section (show if verbose or no errors)
         if warnings and (verbose or not errors):
-            lines.append('-'*70)
-            lines.append('WARNINGS (should be addressed):')
-            lines.append('-'*70)
+            yield from ('-'*70, 'WARNINGS (should be addressed):', '-'*70)
             for i, issue in enumerate(warnings, 1):
-                lines.append(f"\n{i}. {issue}\n")
+                yield f"\n{i}. {issue}\n"
         
         # Info section (show if verbose)
         if infos and verbose:
-            lines.append('-'*70)
-            lines.append('INFORMATION:')
-            lines.append('-'*70)
+            yield from ('-'*70, 'INFORMATION:', '-'*70)
             for i, issue in enumerate(infos, 1):
-                lines.append(f"\n{i}. {issue}\n")
+                yield f"\n{i}. {issue}\n"
         
-        lines.append('='*70)
+        yield '='*70
         
         if not verbose and (warnings or infos):
-            lines.append("\nUse --verbose to see all issues")
-        
-        return '\n'.join(lines)
+            yield "\nUse --verbose to see all issues"
 
 
-def validate_skill_cli():
-    """Command-line interface for skill validation"""
-    import argparse
+
+# Where --cache stores results when no path is given
+DEFAULT_CACHE_PATH = str(Path.home() / ".cache" / "skill-factory" / "validate.shelve")
+
+
+# Boolean flags the fast argv path understands, mapped to their argparse dest
+_CLI_FLAGS = {
+    '--strict': 'strict',
+    '--verbose': 'verbose',
+    '-v': 'verbose',
+    '--json': 'json',
+    '--json-pretty': 'json_pretty',
+    '--cache': 'cache',
+    '--debug': 'debug',
+}
+
+
+def _parse_args_fast(argv: List[str]):
+    """
+    Parse the common CLI invocations without importing argparse
     
-    parser = argparse.ArgumentParser(
-        description='Validate Claude Skills against Anthropic standards',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+    Returns None for anything outside the plain flag set (help, unknown or
+    abbreviated options, no skill path) so the caller can fall back to
+    argparse for faithful help text and error messages.
+    """
+    import types
+    
+    args = types.SimpleNamespace(skill_paths=[], strict=False, verbose=False, json=False,
+                                 json_pretty=False, cache=False, cache_file=DEFAULT_CACHE_PATH,
+                                 debug=False)
+    it = iter(argv)
+    for arg in it:
+        if arg in _CLI_FLAGS:
+            setattr(args, _CLI_FLAGS[arg], True)
+        elif arg == '--cache-file':
+            args.cache_file = next(it, None)
+            if args.cache_file is None or args.cache_file.startswith('-'):
+                return None
+        elif arg.startswith('--cache-file='):
+            args.cache_file = arg.partition('=')[2]
+        elif arg.startswith('-'):
+            return None
+        else:
+            args.skill_paths.append(arg)
+    return args if args.skill_paths else None
+
+
+# Only rendered by --help
+_CLI_EPILOG = """
 Examples:
   python validate_skill.py ./my-skill
   python validate_skill.py ./my-skill --verbose
   python validate_skill.py ./my-skill --strict
   python validate_skill.py ./my-skill --json
+  python validate_skill.py ./my-skill --json-pretty
+  python validate_skill.py ./my-skill --cache
+  python validate_skill.py ./skill-a ./skill-b ./skill-c
+
+--json is compact; pipe it through `jq .` or use --json-pretty to read it.
         """
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """Full argparse parser, used for --help and anything the fast path rejects; built once per process"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description='Validate Claude Skills against Anthropic standards',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_CLI_EPILOG
     )
-    parser.add_argument('skill_path', help='Path to skill folder')
+    parser.add_argument('skill_paths', nargs='+', metavar='skill_path',
+                       help='Path to skill folder; pass several to validate them in one run')
     parser.add_argument('--strict', action='store_true',
                        help='Treat warnings as errors')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Show all issues including info messages')
     parser.add_argument('--json', action='store_true',
-                       help='Output results as JSON')
+                       help='Output results as compact JSON')
+    parser.add_argument('--json-pretty', action='store_true',
+                       help='Output results as indented JSON')
+    parser.add_argument('--cache', action='store_true',
+                       help='Reuse results from earlier runs when the skill is unchanged')
+    parser.add_argument('--cache-file', default=DEFAULT_CACHE_PATH, metavar='PATH',
+                       help=f'Cache location for --cache (default: {DEFAULT_CACHE_PATH})')
+    parser.add_argument('--debug', action='store_true',
+                       help='Print the full traceback if validation crashes (or set DEBUG=1)')
+    return parser
+
+
+# Severity -> JSON string, so the --json loop does a dict lookup instead of Enum.value
+_SEVERITY_JSON = {severity: severity.value for severity in Severity}
+
+# Reads every field the --json output needs in one C-level call per issue
+_ISSUE_FIELDS = operator.attrgetter('severity', 'message', 'location', 'line_number', 'fix_suggestion')
+
+
+def _dump_json(result, pretty: bool) -> bytes:
+    """Serialise CLI JSON output to UTF-8 bytes, newline included"""
+    # orjson is optional; it returns UTF-8 bytes directly and is much faster than json
+    try:
+        import orjson
+    except ImportError:
+        import json
+        if pretty:
+            data = json.dumps(result, indent=2)
+        else:
+            data = json.dumps(result, separators=(',', ':'))
+        # json escapes non-ASCII by default, so this encode is a plain copy
+        return data.encode('ascii') + b'\n'
+    option = orjson.OPT_APPEND_NEWLINE
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(result, option=option)
+
+
+def validate_skill_cli():
+    """
+    Command-line interface for skill validation
+    
+    Several skill folders can be passed at once so batch runs (CI, editor
+    hooks) pay interpreter start-up and imports once instead of per skill.
+    """
+    args = _parse_args_fast(sys.argv[1:])
+    if args is None:
+        args = _build_parser().parse_intermixed_args()
+    
+    as_json = args.json or args.json_pretty
+    cache_path = args.cache_file if args.cache else None
     
-    args = parser.parse_args()
+    # Reject missing paths before building any validator; 2 matches argparse's usage errors
+    for raw_path in args.skill_paths:
+        if not os.path.isdir(raw_path):
+            problem = "not a directory" if os.path.exists(raw_path) else "path not found"
+            print(f"✗ Error: {problem}: {raw_path}", file=sys.stderr)
+            sys.exit(2)
     
     try:
-        # Create validator
-        validator = SkillValidator(args.skill_path)
-        
-        # Run validation
-        is_valid, issues = validator.validate()
-        
-        # Handle --strict mode
-        if args.strict:
-            warnings = [i for i in issues if i.severity == Severity.WARNING]
-            if warnings:
-                is_valid = False
-        
-        # Handle --json output
-        if args.json:
-            result = {
-                "valid": is_valid,
-                "skill_path": str(validator.skill_path),
-                "skill_name": validator.skill_path.name,
-                "issues": [
-                    {
-                        "severity": issue.severity.value,
-                        "message": issue.message,
-                        "location": issue.location,
-                        "line_number": issue.line_number,
-                        "fix_suggestion": issue.fix_suggestion
-                    }
-                    for issue in issues
-                ]
-            }
-            print(json.dumps(result, indent=2))
-        else:
-            # Print report
-            report = validator.generate_report(verbose=args.verbose)
-            print(report)
+        all_valid = True
+        results = []
+        for index, raw_path in enumerate(args.skill_paths):
+            # Create validator; the path is built once and reused for the JSON fields below
+            skill_path = Path(raw_path)
+            validator = SkillValidator(skill_path, cache_path=cache_path)
+            
+            # Run validation
+            validation = validator.validate()
+            is_valid, issues = validation
+            
+            # Handle --strict mode
+            if args.strict:
+                if validation.warnings:
+                    is_valid = False
+            all_valid = all_valid and is_valid
+            
+            # Handle --json output
+            if as_json:
+                results.append({
+                    "valid": is_valid,
+                    "skill_path": str(skill_path),
+                    "skill_name": skill_path.name,
+                    "issues": [
+                        {
+                            "severity": _SEVERITY_JSON[severity],
+                            "message": message,
+                            "location": location,
+                            "line_number": line_number,
+                            "fix_suggestion": fix_suggestion
+                        }
+                        for severity, message, location, line_number, fix_suggestion in map(_ISSUE_FIELDS, issues)
+                    ]
+                })
+            else:
+                if index:
+                    sys.stdout.write("\n")
+                # Print report, streamed rather than joined into one string first
+                validator.generate_report(verbose=args.verbose, out=sys.stdout)
         
-        # Exit with appropriate code
-        sys.exit(0 if is_valid else 1)
+        if as_json:
+            # One skill keeps the single-object output; several become an array
+            data = _dump_json(results[0] if len(results) == 1 else results, args.json_pretty)
+            # Bytes either way, so skip the text layer and write them in one call; streams
+            # without a binary buffer (StringIO redirects, IDLE) get the decoded text instead
+            buffer = getattr(sys.stdout, "buffer", None)
+            if buffer is None:
+                sys.stdout.write(data.decode('utf-8'))
+            else:
+                sys.stdout.flush()
+                buffer.write(data)
+                buffer.flush()
         
     except KeyboardInterrupt:
         print("\n\nValidation cancelled by user.")
         sys.exit(130)
     except Exception as e:
         print(f"\n✗ Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        # traceback pulls in linecache and tokenize, so only load it when asked to
+        if args.debug or os.environ.get('DEBUG'):
+            import traceback
+            traceback.print_exc()
+        else:
+            print("Re-run with --debug for the full traceback.")
         sys.exit(1)
+    
+    # Exit with appropriate code; outside the try so SystemExit skips the handlers above
+    sys.exit(0 if all_valid else 1)
 
 
 if __name__ == "__main__":